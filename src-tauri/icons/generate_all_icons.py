@@ -2,34 +2,28 @@
 """Generate all required icon files from the master PNG."""
 
 import os
+import struct
 import subprocess
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
 from PIL import Image
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 master_png = os.path.join(script_dir, 'rippr_logo_master.png')
 
-# Load master image
-img = Image.open(master_png).convert('RGBA')
-
-print("Generating all icon sizes...")
-
 # Standard PNG icons
-png_sizes = {
+PNG_SIZES = {
     '32x32.png': 32,
     '128x128.png': 128,
     '128x128@2x.png': 256,
     'icon.png': 512,
 }
 
-for filename, size in png_sizes.items():
-    resized = img.resize((size, size), Image.Resampling.LANCZOS)
-    path = os.path.join(script_dir, filename)
-    resized.save(path, 'PNG')
-    print(f"  Created: {filename}")
-
 # Windows Square icons
-square_sizes = {
+SQUARE_SIZES = {
     'Square30x30Logo.png': 30,
     'Square44x44Logo.png': 44,
     'Square71x71Logo.png': 71,
@@ -42,36 +36,11 @@ square_sizes = {
     'StoreLogo.png': 50,
 }
 
-for filename, size in square_sizes.items():
-    resized = img.resize((size, size), Image.Resampling.LANCZOS)
-    path = os.path.join(script_dir, filename)
-    resized.save(path, 'PNG')
-    print(f"  Created: {filename}")
-
-# Generate .ico for Windows (properly with all sizes)
-ico_path = os.path.join(script_dir, 'icon.ico')
-ico_sizes = [16, 24, 32, 48, 64, 128, 256]
-ico_images = []
-
-for size in ico_sizes:
-    resized = img.resize((size, size), Image.Resampling.LANCZOS)
-    ico_images.append(resized)
-
-# Save ICO with all sizes embedded
-ico_images[0].save(
-    ico_path,
-    format='ICO',
-    sizes=[(s, s) for s in ico_sizes],
-    append_images=ico_images[1:]
-)
-print(f"  Created: icon.ico")
-
-# Generate .icns for macOS using iconutil
-print("Generating macOS .icns...")
-iconset_dir = os.path.join(script_dir, 'icon.iconset')
-os.makedirs(iconset_dir, exist_ok=True)
-
-icns_sizes = [
+# Windows .ico (all sizes embedded in one file)
+ICO_SIZES = [16, 24, 32, 48, 64, 128, 256]
+
+# macOS .icns, assembled by iconutil from an iconset directory
+ICNS_SIZES = [
     ('icon_16x16.png', 16),
     ('icon_16x16@2x.png', 32),
     ('icon_32x32.png', 32),
@@ -84,15 +53,165 @@ icns_sizes = [
     ('icon_512x512@2x.png', 1024),
 ]
 
-for filename, size in icns_sizes:
-    resized = img.resize((size, size), Image.Resampling.LANCZOS)
-    resized.save(os.path.join(iconset_dir, filename), 'PNG')
-
-icns_path = os.path.join(script_dir, 'icon.icns')
-subprocess.run(['iconutil', '-c', 'icns', iconset_dir, '-o', icns_path], check=True)
-print(f"  Created: icon.icns")
-
-# Clean up iconset directory
-shutil.rmtree(iconset_dir)
-
-print("\nAll icons generated successfully!")
+# zlib level for the shipped PNGs, and a much cheaper one for PNGs that are
+# only intermediates (iconset files deleted after iconutil, ICO sub-images
+# whose size is negligible)
+DEFAULT_COMPRESS_LEVEL = 6
+FAST_COMPRESS_LEVEL = 1
+
+
+def downscale(src, size):
+    """Resize src to size x size, box-averaging exact integer reductions.
+
+    Image.reduce() is much cheaper than a Lanczos convolution and looks the
+    same at icon sizes; fractional ratios still go through LANCZOS.
+    """
+    factor, remainder = divmod(src.width, size)
+    if remainder == 0 and factor > 1:
+        return src.reduce(factor)
+    return src.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def build_pyramid(img):
+    """Return successive 2x reductions of img, keyed by width, down to 16px."""
+    pyramid = {img.width: img}
+    level = img.width
+    while level > 16:
+        parent, level = level, level // 2
+        pyramid[level] = downscale(pyramid[parent], level)
+    return pyramid
+
+
+def resize(pyramid, size):
+    """Resize to size x size from the nearest pyramid level >= size."""
+    parent = min(k for k in pyramid if k >= size)
+    if parent == size:
+        return pyramid[parent]
+    return downscale(pyramid[parent], size)
+
+
+def save_pngs(pool, resized, items):
+    """Write (path, size, compress_level) PNGs from the resized cache in parallel."""
+    def save(item):
+        path, size, compress_level = item
+        resized[size].save(path, 'PNG', compress_level=compress_level)
+        return path
+
+    return list(pool.map(save, items))
+
+
+def encode_png(image):
+    """Encode an image to PNG bytes in memory."""
+    buf = BytesIO()
+    image.save(buf, 'PNG', compress_level=FAST_COMPRESS_LEVEL)
+    return buf.getvalue()
+
+
+def write_ico(path, sizes, blobs):
+    """Write an ICO container embedding one PNG blob per size.
+
+    The format is a 6-byte header, one 16-byte directory entry per image and
+    then the image data; a width/height byte of 0 means 256.
+    """
+    offset = 6 + 16 * len(blobs)
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<HHH', 0, 1, len(blobs)))
+        for size, blob in zip(sizes, blobs):
+            # width, height, palette colors, reserved, planes, bpp, length, offset
+            f.write(struct.pack('<BBBBHHII', size & 0xff, size & 0xff, 0, 0,
+                                1, 32, len(blob), offset))
+            offset += len(blob)
+        for blob in blobs:
+            f.write(blob)
+
+
+def optimize_pngs(paths):
+    """Losslessly recompress shipped PNGs with oxipng, if it is installed.
+
+    oxipng is multithreaded and compresses better than Pillow's optimize=True,
+    so it runs once over all final files. Ephemeral iconset and ICO PNGs are
+    not worth optimizing and are never passed here.
+    """
+    oxipng = shutil.which('oxipng')
+    if oxipng is None:
+        print("  Skipped PNG optimization (oxipng not found)")
+        return
+    subprocess.run([oxipng, '-q', '-o', '2', '--strip', 'safe',
+                    '-t', str(os.cpu_count()), *paths], check=True)
+    print(f"  Optimized {len(paths)} PNGs with oxipng")
+
+
+def build_png_icons(pool, resized):
+    """Write the standard and Windows Square PNG icons."""
+    items = [(os.path.join(script_dir, filename), size, DEFAULT_COMPRESS_LEVEL)
+             for filename, size in list(PNG_SIZES.items()) + list(SQUARE_SIZES.items())]
+    paths = save_pngs(pool, resized, items)
+    for path in paths:
+        print(f"  Created: {os.path.basename(path)}")
+    optimize_pngs(paths)
+
+
+def build_ico(pool, resized):
+    """Write icon.ico for Windows with all ICO_SIZES embedded."""
+    # Assemble the ICO from the PNG-encoded sizes, rather than letting Pillow's
+    # ICO plugin encode each sub-image again serially
+    blobs = list(pool.map(encode_png, [resized[s] for s in ICO_SIZES]))
+    write_ico(os.path.join(script_dir, 'icon.ico'), ICO_SIZES, blobs)
+    print(f"  Created: icon.ico")
+
+
+def build_icns(pool, resized):
+    """Write icon.icns for macOS using iconutil."""
+    print("Generating macOS .icns...")
+
+    # Build the iconset in the system temp directory (point TMPDIR at a RAM disk
+    # to skip disk I/O entirely); iconutil requires the .iconset suffix
+    temp_dir = tempfile.mkdtemp()
+    try:
+        iconset_dir = os.path.join(temp_dir, 'icon.iconset')
+        os.makedirs(iconset_dir)
+        items = [(os.path.join(iconset_dir, filename), size, FAST_COMPRESS_LEVEL)
+                 for filename, size in ICNS_SIZES]
+        save_pngs(pool, resized, items)
+
+        icns_path = os.path.join(script_dir, 'icon.icns')
+        subprocess.run(['iconutil', '-c', 'icns', iconset_dir, '-o', icns_path], check=True)
+        print(f"  Created: icon.icns")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def main(png=True, ico=True, icns=True):
+    """Generate the requested icon outputs from the master PNG."""
+    img = Image.open(master_png).convert('RGBA')
+    pyramid = build_pyramid(img)
+
+    # Many sizes are shared between the PNG, ICO and ICNS outputs, so resize
+    # each distinct size once and reuse it everywhere
+    sizes = set()
+    if png:
+        sizes.update(PNG_SIZES.values(), SQUARE_SIZES.values())
+    if ico:
+        sizes.update(ICO_SIZES)
+    if icns:
+        sizes.update(size for _, size in ICNS_SIZES)
+
+    # Every resize and save is independent, and Pillow releases the GIL while
+    # resampling and encoding, so run them on a thread pool
+    print("Generating all icon sizes...")
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        sizes = sorted(sizes)
+        resized = dict(zip(sizes, pool.map(partial(resize, pyramid), sizes)))
+
+        if png:
+            build_png_icons(pool, resized)
+        if ico:
+            build_ico(pool, resized)
+        if icns:
+            build_icns(pool, resized)
+
+    print("\nAll icons generated successfully!")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,71 +4,79 @@ Rippr Logo Generator v2
 Clean, bold design that works well as an app icon.
 """
 
-import math
+import numpy as np
 from PIL import Image, ImageDraw
 
 SIZE = 1024
-CENTER = SIZE // 2
 
 # Color palette
 DEEP_BLACK = (18, 18, 22)
 ELECTRIC_CORAL = (255, 95, 75)
 BRIGHT_CORAL = (255, 120, 100)
 
-def create_rippr_logo():
-    """Generate the Rippr app icon - clean and bold."""
+def create_rippr_logo(size=SIZE):
+    """Generate the Rippr app icon - clean and bold.
+
+    All geometry scales with ``size``, so the icon can be rasterized
+    directly at any resolution; the default renders the 1024px master.
+    """
+    center = size // 2
 
     # Create canvas with solid dark background
-    img = Image.new('RGBA', (SIZE, SIZE), (0, 0, 0, 0))  # Transparent base
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))  # Transparent base
     draw = ImageDraw.Draw(img)
 
     # Draw solid dark circle background (for rounded icon look)
-    padding = 40
-    draw.ellipse([padding, padding, SIZE - padding, SIZE - padding], fill=DEEP_BLACK)
+    padding = size * 40 / SIZE
+    draw.ellipse([padding, padding, size - padding, size - padding], fill=DEEP_BLACK)
 
     # Waveform parameters
-    wave_y_center = CENTER
+    wave_y_center = center
     num_bars = 17
-    bar_spacing = SIZE * 0.035
+    bar_spacing = size * 0.035
     total_width = (num_bars - 1) * bar_spacing
-    start_x = CENTER - total_width / 2
+    start_x = center - total_width / 2
 
     # Bar heights - creates a waveform envelope shape
     # Peak in the middle, tapering at edges
-    heights = []
-    for i in range(num_bars):
-        # Distance from center (0 to 1)
-        dist_from_center = abs(i - (num_bars - 1) / 2) / ((num_bars - 1) / 2)
+    i = np.arange(num_bars)
+
+    # Distance from center (0 to 1)
+    dist_from_center = np.abs(i - (num_bars - 1) / 2) / ((num_bars - 1) / 2)
 
-        # Envelope shape - higher in middle
-        envelope = 1.0 - (dist_from_center ** 1.5) * 0.7
+    # Envelope shape - higher in middle
+    envelope = 1.0 - (dist_from_center ** 1.5) * 0.7
 
-        # Add some variation
-        variation = 0.85 + 0.15 * math.sin(i * 1.2)
+    # Add some variation
+    variation = 0.85 + 0.15 * np.sin(i * 1.2)
 
-        height = SIZE * 0.32 * envelope * variation
-        heights.append(height)
+    heights = size * 0.32 * envelope * variation
 
-    # Draw waveform bars
-    bar_width = SIZE * 0.022
+    # Gradient effect - brighter in center
+    electric = np.array(ELECTRIC_CORAL, dtype=float)
+    bright = np.array(BRIGHT_CORAL, dtype=float)
+    colors = (electric + (bright - electric) * (1 - dist_from_center)[:, None]).astype(np.uint8)
 
-    for i in range(num_bars):
-        x = start_x + i * bar_spacing
-        height = heights[i]
+    xs = start_x + i * bar_spacing
 
-        y1 = wave_y_center - height / 2
-        y2 = wave_y_center + height / 2
+    # Rasterize all bars in one pass: each bar is a capsule (a vertical
+    # segment of half-length core, thickened by radius), and bars never
+    # overlap, so every column belongs to at most its nearest bar
+    bar_width = size * 0.022
+    radius = bar_width / 2
+    core = np.maximum(heights / 2 - radius, 0)
 
-        # Gradient effect - brighter in center
-        dist_from_center = abs(i - (num_bars - 1) / 2) / ((num_bars - 1) / 2)
-        r = int(ELECTRIC_CORAL[0] + (BRIGHT_CORAL[0] - ELECTRIC_CORAL[0]) * (1 - dist_from_center))
-        g = int(ELECTRIC_CORAL[1] + (BRIGHT_CORAL[1] - ELECTRIC_CORAL[1]) * (1 - dist_from_center))
-        b = int(ELECTRIC_CORAL[2] + (BRIGHT_CORAL[2] - ELECTRIC_CORAL[2]) * (1 - dist_from_center))
+    cols = np.arange(size)
+    bar = np.clip(np.rint((cols - start_x) / bar_spacing).astype(int), 0, num_bars - 1)
+    dx = cols - xs[bar]
+    dy = np.maximum(np.abs(cols[:, None] - wave_y_center) - core[bar], 0)
+    # PIL's shape edges are inclusive, hence the extra half pixel
+    mask = dx ** 2 + dy ** 2 <= (radius + 0.5) ** 2
 
-        # Draw rounded bar
-        radius = bar_width / 2
-        draw.rounded_rectangle([x - bar_width/2, y1, x + bar_width/2, y2],
-                               radius=radius, fill=(r, g, b))
+    pixels = np.array(img)
+    pixels[mask, :3] = np.broadcast_to(colors[bar], (size, size, 3))[mask]
+    pixels[mask, 3] = 255
+    img = Image.fromarray(pixels, 'RGBA')
 
     return img
 